@@ -1,10 +1,14 @@
+import os
+import queue
+import re
+import threading
 import time
-from typing import Optional
+from typing import Optional, Tuple
 
 from config import (
     BOT_OUT_PREFIX,
     BOT_PREFIX,
-    COOLDOWN_SECONDS,
+    COOLDOWN_NS,
     POLL_SECONDS,
     logger,
 )
@@ -13,6 +17,10 @@ from services.message_sender import MessageSender
 from services.openai_client import OpenAIClient
 from utils.message_decoder import MessageDecoder
 
+# Compiled once: a case-insensitive search avoids lowering (and copying)
+# every polled message just to look for the trigger
+_TRIGGER_RE = re.compile(re.escape(BOT_PREFIX), re.IGNORECASE)
+
 
 class iMessageBot:
     """Main bot class that monitors and responds to messages."""
@@ -31,7 +39,50 @@ class iMessageBot:
 
         self.last_seen_id: Optional[int] = None
         self.last_debug_id: Optional[int] = None
-        self.last_reply_time = 0.0
+        self.last_reply_ns = 0
+        self._last_db_sig: Optional[Tuple] = None
+        # Prompts are handed to a worker thread so the poll loop keeps
+        # draining new messages during the (multi-second) OpenAI call
+        self._prompt_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def _reply_worker(self) -> None:
+        """Drain queued prompts: call OpenAI and send replies."""
+        while True:
+            prompt = self._prompt_queue.get()
+            if prompt is None:
+                break
+
+            try:
+                # Stream the reply and send each sentence as soon as
+                # it is ready instead of waiting for the whole thing
+                for sentence in self.ai_client.chat_stream(prompt):
+                    logger.info("Outgoing: %r", sentence[:200])
+                    self.last_reply_ns = time.monotonic_ns()
+                    self.send_reply(sentence)
+            except Exception as e:
+                logger.exception("Reply worker error: %r", e)
+
+    def _db_changed(self) -> bool:
+        """
+        Cheap change probe: stat chat.db and its WAL instead of querying.
+
+        Messages.app appends to the WAL on every write, so an unchanged
+        mtime/size pair means no new rows and the poll can skip SQLite
+        entirely. Errors count as "changed" so we fall back to querying.
+        """
+        sig = []
+        for path in (self.db.db_path, self.db.db_path + "-wal"):
+            try:
+                st = os.stat(path)
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        sig = tuple(sig)
+
+        if sig != self._last_db_sig or sig == (None, None):
+            self._last_db_sig = sig
+            return True
+        return False
 
     def initialize(self) -> None:
         """Initialize bot state from latest message."""
@@ -58,12 +109,11 @@ class iMessageBot:
             return False
 
         # Respond to messages containing the trigger prefix anywhere in the message
-        if BOT_PREFIX.lower() not in text.lower():
+        if _TRIGGER_RE.search(text) is None:
             return False
 
-        # Cooldown check
-        now = time.time()
-        if now - self.last_reply_time < COOLDOWN_SECONDS:
+        # Cooldown check (monotonic: immune to wall-clock jumps)
+        if time.monotonic_ns() - self.last_reply_ns < COOLDOWN_NS:
             return False
 
         return True
@@ -71,14 +121,11 @@ class iMessageBot:
     def extract_prompt(self, text: str) -> str:
         """Extract user prompt from message text (remove trigger prefix)."""
         # Case-insensitive replacement of the first occurrence of BOT_PREFIX
-        text_lower = text.lower()
-        prefix_lower = BOT_PREFIX.lower()
-        if prefix_lower in text_lower:
-            # Find the position in the original string (case-insensitive)
-            idx = text_lower.find(prefix_lower)
+        m = _TRIGGER_RE.search(text)
+        if m:
             # Remove the prefix and clean up surrounding whitespace
-            before = text[:idx].rstrip()
-            after = text[idx + len(BOT_PREFIX):].lstrip()
+            before = text[:m.start()].rstrip()
+            after = text[m.end():].lstrip()
             # Combine with a single space if both parts exist
             if before and after:
                 prompt = before + " " + after
@@ -121,10 +168,25 @@ class iMessageBot:
 
         self.initialize()
 
+        worker = threading.Thread(target=self._reply_worker, daemon=True)
+        worker.start()
+
         try:
             while True:
                 try:
-                    rows = self.db.fetch_messages(self.chat_id, limit=30)
+                    # Idle ticks don't even touch SQLite: if neither the db
+                    # nor its WAL changed on disk, nothing was written.
+                    if not self._db_changed():
+                        time.sleep(POLL_SECONDS)
+                        continue
+
+                    # Incremental fetch: only rows newer than the last one
+                    # we handled. The common case after a db change that
+                    # wasn't ours returns zero rows, with no attributedBody
+                    # decoding for already-seen messages.
+                    rows = self.db.fetch_messages(
+                        self.chat_id, limit=30, since_rowid=self.last_seen_id
+                    )
                     if not rows:
                         time.sleep(POLL_SECONDS)
                         continue
@@ -152,12 +214,8 @@ class iMessageBot:
                         )
                         self.last_debug_id = msg_id
 
-                    # Check if message is already seen (skip old messages)
-                    if self.last_seen_id is not None and msg_id <= self.last_seen_id:
-                        time.sleep(POLL_SECONDS)
-                        continue
-
-                    # Mark message as seen before processing
+                    # Mark message as seen before processing (rows are
+                    # already strictly newer than last_seen_id)
                     self.last_seen_id = msg_id
 
                     # Check if we should respond (checks prefix, cooldown, etc.)
@@ -165,22 +223,26 @@ class iMessageBot:
                         time.sleep(POLL_SECONDS)
                         continue
 
-                    # Extract prompt and get AI response
+                    # Extract prompt and hand it to the reply worker; the
+                    # loop stays responsive to new triggers while OpenAI
+                    # generates
                     prompt = self.extract_prompt(text)
                     logger.info("Incoming TRIGGER (from_me=%s): %r", from_me, prompt)
-
-                    reply = self.ai_client.chat(prompt)
-                    logger.info("Outgoing: %r", reply[:200])
-
-                    # Send reply
-                    self.last_reply_time = time.time()
-                    self.send_reply(reply)
+                    # Start the cooldown at enqueue, not first send:
+                    # triggers arriving while OpenAI is still generating
+                    # must not each queue their own reply.
+                    self.last_reply_ns = time.monotonic_ns()
+                    self._prompt_queue.put(prompt)
 
                 except KeyboardInterrupt:
                     logger.info("Stopping.")
                     break
                 except Exception as e:
                     logger.exception("Loop error: %r", e)
+                    # _db_changed already consumed this wakeup; clear the
+                    # signature so the next tick re-fetches instead of
+                    # waiting for another write to touch the WAL.
+                    self._last_db_sig = None
 
                 time.sleep(POLL_SECONDS)
 
@@ -189,4 +251,6 @@ class iMessageBot:
         except Exception as e:
             logger.exception("Fatal error: %r", e)
             raise
+        finally:
+            self._prompt_queue.put(None)
 
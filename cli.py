@@ -41,6 +41,10 @@ def main() -> None:
     # Initialize components
     db = MessagesDatabase()
     contacts = ContactsManager()
+    if args.with_contacts:
+        # Enumerating the contact store can take seconds; start it early so
+        # the lookup is (usually) ready by the time the picker needs it.
+        contacts.prewarm()
     ai_client = OpenAIClient()
 
     # Select chat
@@ -1,26 +1,49 @@
 import logging
 import os
+from dataclasses import dataclass
 
-# Database path
-CHAT_DB = os.path.expanduser("~/Library/Messages/chat.db")
 
-# Bot configuration
-BOT_PREFIX = "@zbot"
-BOT_OUT_PREFIX = "🤖 "
-MODEL = "gpt-4o-mini"
+@dataclass(frozen=True)
+class _Config:
+    """Runtime configuration; frozen so nothing can mutate it underfoot."""
 
-# Timing configuration
-POLL_SECONDS = 2
-COOLDOWN_SECONDS = 6
-MAX_CONTEXT_MESSAGES = 20
+    # Database path
+    CHAT_DB: str = os.path.expanduser("~/Library/Messages/chat.db")
 
-# UI configuration
-LIST_LIMIT = 30  # Number of chats shown in the picker
+    # Bot configuration
+    BOT_PREFIX: str = "@zbot"
+    BOT_OUT_PREFIX: str = "🤖 "
+    MODEL: str = "gpt-4o-mini"
+
+    # Timing configuration
+    POLL_SECONDS: int = 2
+    COOLDOWN_SECONDS: int = 6
+    MAX_CONTEXT_MESSAGES: int = 20
+
+    # UI configuration
+    LIST_LIMIT: int = 30  # Number of chats shown in the picker
 
-# Logging setup
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s - %(message)s",
-)
-logger = logging.getLogger("imessage-bot")
 
+CONFIG = _Config()
+
+# Module-level aliases so existing `from config import X` imports keep
+# working; caches and invariants (like the cooldown in nanoseconds for
+# monotonic_ns compares) can rely on these never changing.
+CHAT_DB = CONFIG.CHAT_DB
+BOT_PREFIX = CONFIG.BOT_PREFIX
+BOT_OUT_PREFIX = CONFIG.BOT_OUT_PREFIX
+MODEL = CONFIG.MODEL
+POLL_SECONDS = CONFIG.POLL_SECONDS
+COOLDOWN_SECONDS = CONFIG.COOLDOWN_SECONDS
+COOLDOWN_NS = CONFIG.COOLDOWN_SECONDS * 1_000_000_000
+MAX_CONTEXT_MESSAGES = CONFIG.MAX_CONTEXT_MESSAGES
+LIST_LIMIT = CONFIG.LIST_LIMIT
+
+# Logging setup: only configure the root logger if nothing else has,
+# so importing config stays side-effect free for embedders and tests.
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s - %(message)s",
+    )
+logger = logging.getLogger("imessage-bot")
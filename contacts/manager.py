@@ -1,12 +1,16 @@
-from typing import Dict
+import os
+import pickle
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
 
 try:
     from Contacts import (  # type: ignore
         CNContactStore,
         CNContactFetchRequest,
-        CNContactGivenNameKey,
-        CNContactFamilyNameKey,
-        CNContactNicknameKey,
+        CNContactFormatter,
+        CNContactFormatterStyleFullName,
         CNContactPhoneNumbersKey,
         CNContactEmailAddressesKey,
     )
@@ -19,6 +23,45 @@ from config import logger
 from utils.phone_normalizer import PhoneNormalizer
 from utils.email_normalizer import EmailNormalizer
 
+# Contacts.app's backing store; its mtime tells us when the cached
+# lookup is stale without enumerating CNContactStore.
+_ADDRESSBOOK_DB = os.path.expanduser(
+    "~/Library/Application Support/AddressBook/AddressBook-v22.abcddb"
+)
+_CACHE_PATH = Path("~/.cache/zbot/contacts.pkl").expanduser()
+
+
+def _addressbook_mtime() -> Optional[float]:
+    """mtime of the AddressBook database, or None if unreadable."""
+    try:
+        return os.stat(_ADDRESSBOOK_DB).st_mtime
+    except OSError:
+        return None
+
+
+def _load_cached_lookup(mtime: float) -> Optional[Dict[str, str]]:
+    """Load the pickled lookup if it matches the given source mtime."""
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            cached_mtime, lookup = pickle.load(f)
+        if cached_mtime == mtime and isinstance(lookup, dict):
+            return lookup
+    except Exception:
+        pass
+    return None
+
+
+def _store_cached_lookup(mtime: float, lookup: Dict[str, str]) -> None:
+    """Persist the lookup atomically; caching is best-effort."""
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_PATH.with_suffix(".pkl.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((mtime, lookup), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _CACHE_PATH)
+    except Exception:
+        pass
+
 
 class ContactsManager:
     """Manages contact lookup using macOS Contacts framework."""
@@ -26,66 +69,174 @@ class ContactsManager:
     def __init__(self):
         """Initialize contacts manager."""
         self.lookup: Dict[str, str] = {}
+        self.ready = threading.Event()
+        self._warm_thread: Optional[threading.Thread] = None
+        # Single-slot cache for format_chat_label: steady state is repeat
+        # identifiers from the same few active chats
+        self._last_ci: Optional[str] = None
+        self._last_label: str = ""
+
+    def prewarm(self) -> None:
+        """
+        Build the lookup on a background thread so startup isn't blocked.
+
+        Until the build finishes, format_chat_label falls back to raw
+        identifiers; callers that need the full lookup should use
+        ensure_lookup().
+        """
+        if self.ready.is_set() or self._warm_thread is not None:
+            return
+
+        self._warm_thread = threading.Thread(target=self._warm, daemon=True)
+        self._warm_thread.start()
+
+    def _warm(self) -> None:
+        """
+        Thread target for prewarm: an unexpected build failure must still
+        set the ready event, or ensure_lookup() would wait forever.
+        """
+        try:
+            self.build_lookup()
+        except Exception as e:
+            logger.exception("Contacts prewarm failed: %r", e)
+        finally:
+            self.ready.set()
+
+    def invalidate_lookup(self) -> None:
+        """
+        Force the next ensure_lookup() to rebuild.
+
+        ensure_lookup() memoizes via the ready event, so repeat picker
+        calls never re-enumerate Contacts; call this if the address book
+        changed mid-session. The on-disk cache self-invalidates by mtime.
+        """
+        self.ready.clear()
+        self._warm_thread = None
+        self._last_ci = None
+
+    def ensure_lookup(self) -> Dict[str, str]:
+        """
+        Return the lookup, building it (or waiting on a prewarm) as needed.
+        """
+        if not self.ready.is_set():
+            if self._warm_thread is not None:
+                self.ready.wait()
+            else:
+                self.build_lookup()
+        return self.lookup
 
     def build_lookup(self) -> Dict[str, str]:
         """
         Build a lookup dictionary mapping normalized phone/email to contact names.
         """
-        self.lookup = {}
-
         if not CONTACTS_AVAILABLE:
+            self.ready.set()
             return self.lookup
 
+        # Warm start: reuse the on-disk lookup when Contacts.app's store
+        # hasn't changed since it was written.
+        mtime = _addressbook_mtime()
+        if mtime is not None:
+            cached = _load_cached_lookup(mtime)
+            if cached is not None:
+                self.lookup = cached
+                self._last_ci = None
+                self.ready.set()
+                return self.lookup
+
         store = CNContactStore.alloc().init()
 
+        # The formatter descriptor stands in for the individual name keys,
+        # so less name data crosses the pyobjc bridge per contact
         keys = [
-            CNContactGivenNameKey,
-            CNContactFamilyNameKey,
-            CNContactNicknameKey,
+            CNContactFormatter.descriptorForRequiredKeysForStyle_(
+                CNContactFormatterStyleFullName
+            ),
             CNContactPhoneNumbersKey,
             CNContactEmailAddressesKey,
         ]
         req = CNContactFetchRequest.alloc().initWithKeysToFetch_(keys)
 
+        # Structure-of-arrays staging: the ObjC enumeration callback only
+        # collects raw strings; normalization runs in tight batch loops
+        # afterwards instead of per value inside the bridge callback.
+        phones_raw: list = []
+        emails_raw: list = []
+
         def full_name(contact) -> str:
-            """Extract full name from contact."""
-            given = str(contact.givenName() or "").strip()
-            family = str(contact.familyName() or "").strip()
-            nick = str(contact.nickname() or "").strip()
-            name = (given + " " + family).strip()
-            return name or nick or "(No Name)"
+            """Extract full name from contact via the cached formatter."""
+            name = CNContactFormatter.stringFromContact_style_(
+                contact, CNContactFormatterStyleFullName
+            )
+            return (str(name).strip() if name else "") or "(No Name)"
 
         def handler(contact, _stop_ptr):
-            """Process a contact and add to lookup."""
-            name = full_name(contact)
-
-            # Process phone numbers
-            for labeled in list(contact.phoneNumbers() or []):
-                try:
-                    val = str(labeled.value().stringValue() or "")
-                except Exception:
-                    continue
-                norm = PhoneNormalizer.normalize(val)
-                if norm and norm not in self.lookup:
-                    self.lookup[norm] = name
-
-            # Process email addresses
-            for labeled in list(contact.emailAddresses() or []):
-                try:
-                    val = str(labeled.value() or "")
-                except Exception:
-                    continue
-                norm = EmailNormalizer.normalize(val)
-                if norm and norm not in self.lookup:
-                    self.lookup[norm] = name
+            """Collect a contact's raw identifiers for batch processing."""
+            phones = contact.phoneNumbers()
+            emails = contact.emailAddresses()
+
+            # Contacts with no phone or email (mail-only imports, company
+            # cards) contribute nothing — skip before formatting the name.
+            if not phones and not emails:
+                return
+
+            # Every phone/email of a contact stores the same name string;
+            # interning makes all those entries share one object.
+            name = sys.intern(full_name(contact))
+
+            # Index into the NSArrays directly: objectAtIndex_ bridges
+            # one element at a time, skipping the enumerator object the
+            # iteration protocol would otherwise create per contact.
+            if phones:
+                for i in range(phones.count()):
+                    labeled = phones.objectAtIndex_(i)
+                    try:
+                        val = str(labeled.value().stringValue() or "")
+                    except Exception:
+                        continue
+                    phones_raw.append((name, val))
+
+            if emails:
+                for i in range(emails.count()):
+                    labeled = emails.objectAtIndex_(i)
+                    try:
+                        val = str(labeled.value() or "")
+                    except Exception:
+                        continue
+                    emails_raw.append((name, val))
 
         ok, err = store.enumerateContactsWithFetchRequest_error_usingBlock_(
             req, None, handler
         )
         if not ok:
             logger.warning("Could not enumerate contacts: %r", err)
+            self.ready.set()
             return {}
 
+        # Build into a local dict and swap at the end so readers on other
+        # threads never observe a half-built lookup. setdefault keeps the
+        # first contact seen per identifier, as before; phone and email
+        # keys never collide so the split loops preserve ordering.
+        lookup: Dict[str, str] = {}
+
+        normalize_phone = PhoneNormalizer.normalize
+        for name, raw in phones_raw:
+            norm = normalize_phone(raw)
+            if norm:
+                lookup.setdefault(norm, name)
+
+        normalize_email = EmailNormalizer.normalize
+        for name, raw in emails_raw:
+            norm = normalize_email(raw)
+            if norm:
+                lookup.setdefault(norm, name)
+
+        if mtime is not None:
+            _store_cached_lookup(mtime, lookup)
+
+        self.lookup = lookup
+        self._last_ci = None
+        self.ready.set()
         return self.lookup
 
     def format_chat_label(
@@ -100,15 +251,23 @@ class ContactsManager:
         if dn:
             return dn
 
-        # Try to resolve identifier as phone
-        phone = PhoneNormalizer.normalize(ci)
-        if phone and phone in self.lookup:
-            return f"{self.lookup[phone]} ({phone})"
+        if ci == self._last_ci:
+            return self._last_label
+
+        # An identifier is unambiguously an email or a phone, so run only
+        # the matching normalizer and do one dict lookup.
+        if "@" in ci:
+            key = EmailNormalizer.normalize(ci)
+        else:
+            key = PhoneNormalizer.normalize(ci)
 
-        # Try to resolve identifier as email
-        email = EmailNormalizer.normalize(ci)
-        if email and email in self.lookup:
-            return f"{self.lookup[email]} ({email})"
+        name = self.lookup.get(key) if key else None
+        if name:
+            label = f"{name} ({key})"
+        else:
+            label = ci or "(Unknown)"
 
-        return ci or "(Unknown)"
+        self._last_ci = ci
+        self._last_label = label
+        return label
 
@@ -1,8 +1,38 @@
 import sqlite3
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from config import CHAT_DB
 
+# The poll loop re-runs these every POLL_SECONDS, so the SQL text is
+# built once; identical text lets sqlite3's per-connection statement
+# cache reuse the prepared statement instead of re-parsing.
+_FETCH_MESSAGES_SQL = """
+    SELECT
+        message.ROWID as msg_id,
+        message.text as text,
+        message.attributedBody as attributedBody,
+        message.is_from_me as is_from_me
+    FROM message
+    JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
+    WHERE cmj.chat_id = ?
+    ORDER BY message.ROWID DESC
+    LIMIT ?
+"""
+
+_FETCH_MESSAGES_SINCE_SQL = """
+    SELECT
+        message.ROWID as msg_id,
+        message.text as text,
+        message.attributedBody as attributedBody,
+        message.is_from_me as is_from_me
+    FROM message
+    JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
+    WHERE cmj.chat_id = ? AND message.ROWID > ?
+    ORDER BY message.ROWID DESC
+    LIMIT ?
+"""
+
 
 class MessagesDatabase:
     """Handles read-only operations on the Messages chat.db database."""
@@ -15,106 +45,252 @@ class MessagesDatabase:
             db_path: Path to Messages chat.db file
         """
         self.db_path = db_path
+        # One connection per thread: sqlite3 connections aren't thread-safe,
+        # and reusing a connection keeps SQLite's page cache warm between polls.
+        self._local = threading.local()
 
     def _connect(self) -> sqlite3.Connection:
         """
-        Create a read-only connection to the database.
+        Get this thread's read-only connection, creating it on first use.
 
         Returns:
             SQLite connection object
         """
-        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA busy_timeout = 2000;")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout = 2000;")
+            # Read-tuning for the persistent connection: no journal
+            # bookkeeping, mmap'd reads, and a pinned 20MB page cache so
+            # hot pages survive between poll ticks.
+            conn.execute("PRAGMA query_only = 1;")
+            conn.execute("PRAGMA mmap_size = 268435456;")
+            conn.execute("PRAGMA cache_size = -20000;")
+            conn.execute("PRAGMA temp_store = MEMORY;")
+            self._local.conn = conn
+            self._local.cur = conn.cursor()
         return conn
 
+    def _cursor(self) -> sqlite3.Cursor:
+        """
+        Get this thread's shared cursor.
+
+        sqlite3 caches prepared statements per connection keyed by SQL
+        text, so re-executing the poll queries through one long-lived
+        cursor skips the parse/plan step after the first call. All query
+        methods fetch their results before returning, so sharing one
+        cursor per thread is safe.
+        """
+        self._connect()
+        return self._local.cur
+
+    def close(self) -> None:
+        """Close the current thread's connection, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            self._local.cur = None
+
     def fetch_chats(self, limit: int = 3000) -> List[sqlite3.Row]:
         """
         Fetch recent chats from the database.
         """
-        conn = self._connect()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                """
-                SELECT chat.ROWID as chat_id,
-                       chat.display_name,
-                       chat.chat_identifier
-                FROM chat
-                ORDER BY chat.ROWID DESC
-                LIMIT ?
-                """,
-                (limit,),
+        cur = self._connect().cursor()
+        cur.execute(
+            """
+            SELECT chat.ROWID as chat_id,
+                   chat.display_name,
+                   chat.chat_identifier
+            FROM chat
+            ORDER BY chat.ROWID DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return cur.fetchall()
+
+    def fetch_chats_with_latest(
+        self, hint: Optional[str] = None, limit: int = 30
+    ) -> List[Tuple[int, Optional[str], Optional[str], int]]:
+        """
+        Fetch chats joined with their latest message ROWID, newest first.
+
+        One grouped query replaces the fetch-all-chats-then-query-each
+        pattern. When hint is given, display_name/chat_identifier substring
+        filtering happens in SQL too. Rows are plain
+        (chat_id, display_name, chat_identifier, msg_id) tuples: the
+        picker indexes every column anyway, and tuple unpacking beats
+        sqlite3.Row's per-column name lookups.
+        """
+        where = ""
+        params: List = []
+        if hint:
+            where = (
+                "WHERE lower(chat.display_name) LIKE ? ESCAPE '\\' "
+                "OR lower(chat.chat_identifier) LIKE ? ESCAPE '\\'"
             )
-            return cur.fetchall()
-        finally:
-            conn.close()
+            # Escape LIKE metacharacters so a literal % or _ in the hint
+            # matches itself instead of acting as a wildcard.
+            escaped = (
+                hint.lower()
+                .replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
+            like = f"%{escaped}%"
+            params += [like, like]
+        params.append(limit)
+
+        # Dedicated cursor so the plain-tuple row_factory doesn't leak
+        # into the shared one
+        cur = self._connect().cursor()
+        cur.row_factory = None
+        cur.execute(
+            f"""
+            SELECT chat.ROWID as chat_id,
+                   chat.display_name,
+                   chat.chat_identifier,
+                   COALESCE(MAX(message.ROWID), 0) as msg_id
+            FROM chat
+            LEFT JOIN chat_message_join cmj ON cmj.chat_id = chat.ROWID
+            LEFT JOIN message ON message.ROWID = cmj.message_id
+            {where}
+            GROUP BY chat.ROWID
+            ORDER BY msg_id DESC
+            LIMIT ?
+            """,
+            params,
+        )
+        return cur.fetchall()
 
     def get_latest_message_id(self, chat_id: int) -> Optional[int]:
         """
         Get the ROWID of the most recent message in a chat.
         """
-        conn = self._connect()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                """
-                SELECT MAX(message.ROWID) as max_id
-                FROM message
-                JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
-                WHERE cmj.chat_id = ?
-                """,
-                (chat_id,),
-            )
-            row = cur.fetchone()
-            return int(row["max_id"]) if row and row["max_id"] is not None else None
-        finally:
-            conn.close()
+        cur = self._cursor()
+        cur.execute(
+            """
+            SELECT MAX(message.ROWID) as max_id
+            FROM message
+            JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
+            WHERE cmj.chat_id = ?
+            """,
+            (chat_id,),
+        )
+        row = cur.fetchone()
+        return int(row["max_id"]) if row and row["max_id"] is not None else None
+
+    def get_latest_message_ids(self, chat_ids: List[int]) -> Dict[int, int]:
+        """
+        Get the ROWID of the most recent message for each of several chats.
 
-    def fetch_messages(self, chat_id: int, limit: int = 30) -> List[sqlite3.Row]:
+        One grouped query instead of one round-trip per chat. Chats with no
+        messages are absent from the result.
+        """
+        if not chat_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(chat_ids))
+        cur = self._connect().cursor()
+        cur.execute(
+            f"""
+            SELECT cmj.chat_id as chat_id,
+                   MAX(message.ROWID) as max_id
+            FROM message
+            JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
+            WHERE cmj.chat_id IN ({placeholders})
+            GROUP BY cmj.chat_id
+            """,
+            chat_ids,
+        )
+        return {
+            int(row["chat_id"]): int(row["max_id"])
+            for row in cur.fetchall()
+            if row["max_id"] is not None
+        }
+
+    def fetch_messages(
+        self,
+        chat_id: int,
+        limit: int = 30,
+        since_rowid: Optional[int] = None,
+    ) -> List[sqlite3.Row]:
         """
         Fetch recent messages from a chat.
+
+        When since_rowid is given, only rows newer than it are returned,
+        letting SQLite seek on the ROWID index instead of re-reading
+        already-seen messages.
         """
-        conn = self._connect()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                """
+        if since_rowid is None:
+            sql = _FETCH_MESSAGES_SQL
+            params = (chat_id, limit)
+        else:
+            sql = _FETCH_MESSAGES_SINCE_SQL
+            params = (chat_id, since_rowid, limit)
+
+        cur = self._cursor()
+        cur.execute(sql, params)
+        return cur.fetchall()
+
+    def fetch_messages_for_chats(
+        self, chat_ids: List[int], limit: int = 30
+    ) -> Dict[int, List[sqlite3.Row]]:
+        """
+        Fetch recent messages for several chats in one query.
+
+        A ROW_NUMBER() window (SQLite 3.25+, shipped with every modern
+        macOS) caps each chat at `limit` rows, newest first, instead of
+        one round-trip per chat.
+        """
+        if not chat_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(chat_ids))
+        cur = self._connect().cursor()
+        cur.execute(
+            f"""
+            SELECT chat_id, msg_id, text, attributedBody, is_from_me
+            FROM (
                 SELECT
+                    cmj.chat_id as chat_id,
                     message.ROWID as msg_id,
                     message.text as text,
                     message.attributedBody as attributedBody,
-                    message.is_from_me as is_from_me
+                    message.is_from_me as is_from_me,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY cmj.chat_id
+                        ORDER BY message.ROWID DESC
+                    ) as rn
                 FROM message
                 JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
-                WHERE cmj.chat_id = ?
-                ORDER BY message.ROWID DESC
-                LIMIT ?
-                """,
-                (chat_id, limit),
+                WHERE cmj.chat_id IN ({placeholders})
             )
-            return cur.fetchall()
-        finally:
-            conn.close()
+            WHERE rn <= ?
+            """,
+            (*chat_ids, limit),
+        )
+
+        out: Dict[int, List[sqlite3.Row]] = {}
+        for row in cur:
+            out.setdefault(int(row["chat_id"]), []).append(row)
+        return out
 
     def get_chat_name(self, chat_id: int) -> str:
         """
         Get the name/identifier for a chat (used for sending messages).
         """
-        conn = self._connect()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT display_name, chat_identifier FROM chat WHERE ROWID=?",
-                (chat_id,),
-            )
-            row = cur.fetchone()
-            if not row:
-                raise RuntimeError(f"chat_id {chat_id} not found")
-
-            display_name = (row["display_name"] or "").strip()
-            identifier = (row["chat_identifier"] or "").strip()
-            return display_name if display_name else identifier
-        finally:
-            conn.close()
+        cur = self._connect().cursor()
+        cur.execute(
+            "SELECT display_name, chat_identifier FROM chat WHERE ROWID=?",
+            (chat_id,),
+        )
+        row = cur.fetchone()
+        if not row:
+            raise RuntimeError(f"chat_id {chat_id} not found")
 
+        display_name = (row["display_name"] or "").strip()
+        identifier = (row["chat_identifier"] or "").strip()
+        return display_name if display_name else identifier
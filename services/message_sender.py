@@ -1,73 +1,171 @@
 import subprocess
+import threading
+from typing import Optional
+
+try:
+    from ScriptingBridge import SBApplication  # type: ignore
+
+    SCRIPTING_BRIDGE_AVAILABLE = True
+except Exception:
+    SCRIPTING_BRIDGE_AVAILABLE = False
 
 from utils.applescript_escaper import AppleScriptEscaper
 
+# Hard cap on an osascript invocation; a wedged Messages.app must not
+# block the reply worker forever.
+_OSASCRIPT_TIMEOUT = 15
+
+
+def _run_applescript(body: str) -> None:
+    """
+    Run an AppleScript body via one-shot osascript, raising RuntimeError
+    on script errors.
+
+    One process per send: `osascript -i` compiles and executes each
+    stdin line independently, so a multi-line `tell` block can't be fed
+    to a persistent interpreter as one unit. The per-send fork cost is
+    only paid when the ScriptingBridge fast path can't complete a send.
+    """
+    try:
+        result = subprocess.run(
+            ["osascript", "-e", body],
+            capture_output=True,
+            text=True,
+            timeout=_OSASCRIPT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(
+            f"osascript timed out after {_OSASCRIPT_TIMEOUT}s"
+        )
+
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr or "").strip())
+
+# Messages.app bound once through ScriptingBridge; ObjC dispatch per send
+# instead of an osascript round-trip
+_sb_lock = threading.Lock()
+_sb_app = None
+
+
+def _messages_app():
+    """Lazily bind Messages.app via ScriptingBridge."""
+    global _sb_app
+    with _sb_lock:
+        if _sb_app is None:
+            _sb_app = SBApplication.applicationWithBundleIdentifier_(
+                "com.apple.iChat"
+            )
+        return _sb_app
+
 
 class MessageSender:
     """Handles sending messages via AppleScript."""
 
+    @staticmethod
+    def _bridge_send_to_chat(chat_name: str, text: str) -> bool:
+        """
+        Try sending to a named chat via ScriptingBridge.
+
+        Returns False when the bridge can't complete the send, in which
+        case the caller falls back to AppleScript.
+        """
+        if not SCRIPTING_BRIDGE_AVAILABLE:
+            return False
+
+        try:
+            app = _messages_app()
+            if app is None or not app.isRunning():
+                return False
+
+            chat = app.chats().objectWithName_(chat_name)
+            if chat is None or not chat.name():
+                return False
+
+            app.send_to_(text, chat)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _bridge_send_to_handle(handle: str, text: str) -> bool:
+        """
+        Try sending to a buddy handle via ScriptingBridge.
+
+        Returns False when the bridge can't complete the send.
+        """
+        if not SCRIPTING_BRIDGE_AVAILABLE:
+            return False
+
+        try:
+            app = _messages_app()
+            if app is None or not app.isRunning():
+                return False
+
+            for svc in app.services():
+                buddy = svc.buddies().objectWithName_(handle)
+                if buddy is not None and buddy.name():
+                    app.send_to_(text, buddy)
+                    return True
+            return False
+        except Exception:
+            return False
+
     @staticmethod
     def send_to_chat_by_name(chat_name: str, text: str) -> None:
         """
         Send a message to a chat by its name (group chats).
         """
+        if MessageSender._bridge_send_to_chat(chat_name, text):
+            return
+
         safe_name = AppleScriptEscaper.escape(chat_name)
         safe_text = AppleScriptEscaper.escape(text)
 
-        script = f'''
+        body = f'''
         tell application "Messages"
             set targetChat to first chat whose name is "{safe_name}"
             send "{safe_text}" to targetChat
         end tell
         '''
 
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError((result.stderr or "").strip())
+        _run_applescript(body)
 
     @staticmethod
     def send_to_handle(handle: str, text: str) -> None:
         """
         Send a message to a handle (phone/email for 1:1 chats).
         """
+        if MessageSender._bridge_send_to_handle(handle, text):
+            return
+
         safe_handle = AppleScriptEscaper.escape(handle)
         safe_text = AppleScriptEscaper.escape(text)
 
-        script = f'''
+        body = f'''
         tell application "Messages"
             set theText to "{safe_text}"
+            set sentOK to false
 
             -- try iMessage
             try
                 set svc to first service whose service type = iMessage
                 set b to buddy "{safe_handle}" of svc
                 send theText to b
-                return "sent_imessage"
+                set sentOK to true
             end try
 
             -- fallback to SMS (some Macs expose this as "SMS")
-            try
-                set svc2 to first service whose service type = SMS
-                set b2 to buddy "{safe_handle}" of svc2
-                send theText to b2
-                return "sent_sms"
-            end try
+            if not sentOK then
+                try
+                    set svc2 to first service whose service type = SMS
+                    set b2 to buddy "{safe_handle}" of svc2
+                    send theText to b2
+                    set sentOK to true
+                end try
+            end if
 
-            error "No valid service/buddy for {safe_handle}"
+            if not sentOK then error "No valid service/buddy for {safe_handle}"
         end tell
         '''
 
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError((result.stderr or "").strip())
-
+        _run_applescript(body)
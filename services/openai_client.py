@@ -1,13 +1,54 @@
+import collections
 import os
-import random
+import re
 import time
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional
 
+import httpx
 import openai
 from openai import OpenAI
 
 from config import MAX_CONTEXT_MESSAGES, MODEL, logger
 
+# Retry delays per attempt (seconds). The jitter factors are a fixed
+# table rather than RNG calls: desynchronizing a single client's retries
+# doesn't need randomness, just unequal spacing, and the fixed table
+# bounds worst-case total wait.
+_BACKOFFS = (0.75, 1.5, 3.0, 6.0, 12.0, 20.0, 20.0, 20.0)
+_JITTER = (0.9, 1.1, 0.85, 1.15, 0.95, 1.05, 1.0, 0.92)
+
+# Complete sentences end at punctuation followed by whitespace (or a
+# newline); used to carve finished sentences out of the stream buffer
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def _build_http_client() -> httpx.Client:
+    """
+    Tuned transport for the OpenAI SDK: keep-alive connections avoid a
+    TLS handshake per request, HTTP/2 multiplexes concurrent streams.
+    """
+    limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+    try:
+        return httpx.Client(http2=True, timeout=30.0, limits=limits)
+    except ImportError:
+        # h2 extra not installed; plain HTTP/1.1 keep-alive still helps
+        return httpx.Client(timeout=30.0, limits=limits)
+
+
+def _error_code(e: Exception) -> Optional[str]:
+    """Pull the structured error code off an openai SDK exception."""
+    code = getattr(e, "code", None)
+    if code:
+        return code
+
+    body = getattr(e, "body", None)
+    if isinstance(body, dict):
+        err = body.get("error", body)
+        if isinstance(err, dict):
+            return err.get("code")
+
+    return None
+
 
 class OpenAIClient:
     """Manages OpenAI API interactions."""
@@ -25,79 +66,124 @@ class OpenAIClient:
                     "  export OPENAI_API_KEY='sk-proj-...'\n"
                 )
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=_build_http_client())
         self.model = model
-        self.history: List[Dict[str, str]] = []
+        # The system message lives outside the deque so maxlen eviction
+        # only ever drops the oldest conversation turns, in O(1), with no
+        # trimming pass after each append.
+        self._system: Optional[Dict[str, str]] = None
+        self.history: Deque[Dict[str, str]] = collections.deque(
+            maxlen=MAX_CONTEXT_MESSAGES
+        )
 
     def set_system_message(self, content: str) -> None:
         """Set the system message for the conversation."""
-        if self.history and self.history[0].get("role") == "system":
-            self.history[0] = {"role": "system", "content": content}
-        else:
-            self.history.insert(0, {"role": "system", "content": content})
+        self._system = {"role": "system", "content": content}
 
-    def trim_history(self, max_messages: int = MAX_CONTEXT_MESSAGES) -> None:
-        """
-        Trim conversation history to keep it within limits.
-        """
-        system = (
-            self.history[:1]
-            if self.history and self.history[0].get("role") == "system"
-            else []
-        )
-        rest = self.history[1:] if system else self.history
-
-        if len(rest) > max_messages:
-            rest = rest[-max_messages:]
-
-        self.history = system + rest
+    def _messages(self) -> List[Dict[str, str]]:
+        """Build the API message list: system message plus history."""
+        messages: List[Dict[str, str]] = []
+        if self._system is not None:
+            messages.append(self._system)
+        messages.extend(self.history)
+        return messages
 
     def chat(self, user_text: str) -> str:
         """
         Send a message to OpenAI and get a response.
         """
+        return " ".join(self.chat_stream(user_text))
+
+    def chat_stream(self, user_text: str) -> Iterator[str]:
+        """
+        Send a message to OpenAI and yield the response sentence by sentence.
+
+        Streaming lets the caller send the first sentence as soon as it is
+        generated instead of waiting for the full completion. The complete
+        reply is appended to history once the stream ends.
+        """
         self.history.append({"role": "user", "content": user_text})
-        self.trim_history()
 
         attempt = 0
-        backoff = 0.75
 
         while True:
             attempt += 1
             try:
                 response = self.client.chat.completions.create(
                     model=self.model,
-                    messages=self.history,
+                    messages=self._messages(),
+                    stream=True,
                 )
-
-                reply = response.choices[0].message.content
-                reply = (reply or "").strip() or "…"
-
-                self.history.append({"role": "assistant", "content": reply})
-                self.trim_history()
-
-                return reply
+                break
 
             except openai.RateLimitError as e:
-                msg = repr(e)
-                if "insufficient_quota" in msg:
-                    logger.error("OpenAI insufficient_quota: %s", msg)
-                    return "OpenAI quota/billing issue — check API billing."
+                if _error_code(e) == "insufficient_quota":
+                    logger.error("OpenAI insufficient_quota: %r", e)
+                    yield "OpenAI quota/billing issue — check API billing."
+                    return
 
-                logger.error("OpenAI rate-limited: %s", msg)
-                if attempt >= 8:
-                    return "I'm rate-limited — try again in a minute."
+                logger.error("OpenAI rate-limited: %r", e)
+                if attempt >= len(_BACKOFFS):
+                    yield "I'm rate-limited — try again in a minute."
+                    return
 
-                sleep_s = min(20.0, backoff) * (0.8 + random.random() * 0.4)
+                sleep_s = _BACKOFFS[attempt - 1] * _JITTER[attempt - 1]
                 logger.info("Rate limited. Sleeping %.2fs...", sleep_s)
                 time.sleep(sleep_s)
-                backoff *= 2
 
             except openai.AuthenticationError as e:
                 logger.error("OpenAI auth failed: %r", e)
-                return "OpenAI auth failed. Check OPENAI_API_KEY."
+                yield "OpenAI auth failed. Check OPENAI_API_KEY."
+                return
 
             except Exception as e:
                 logger.exception("OpenAI error: %r", e)
-                return "Something went wrong calling OpenAI."
+                yield "Something went wrong calling OpenAI."
+                return
+
+        parts: List[str] = []
+        buffer = ""
+        yielded = False
+
+        try:
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+
+                parts.append(delta)
+                buffer += delta
+
+                # Flush every completed sentence so the first one goes out
+                # while the rest is still being generated. Boundaries can
+                # land mid-delta, so split rather than just checking the
+                # buffer tail.
+                if buffer.rstrip().endswith((".", "!", "?")):
+                    pieces = _SENTENCE_SPLIT_RE.split(buffer)
+                    buffer = ""
+                else:
+                    pieces = _SENTENCE_SPLIT_RE.split(buffer)
+                    buffer = pieces.pop()
+
+                for piece in pieces:
+                    piece = piece.strip()
+                    if piece:
+                        yield piece
+                        yielded = True
+        except Exception as e:
+            logger.exception("OpenAI stream error: %r", e)
+            if not yielded:
+                yield "Something went wrong calling OpenAI."
+                return
+
+        leftover = buffer.strip()
+        if leftover:
+            yield leftover
+            yielded = True
+
+        reply = "".join(parts).strip() or "…"
+        if not yielded:
+            yield reply
+
+        self.history.append({"role": "assistant", "content": reply})
 
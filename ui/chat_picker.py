@@ -1,9 +1,12 @@
-from typing import Optional, Tuple, List
+import os
+from typing import Dict, Optional, Tuple, List
 
 from config import LIST_LIMIT
 from contacts.manager import ContactsManager, CONTACTS_AVAILABLE
 from db.messages import MessagesDatabase
 
+_QUIT_WORDS = frozenset({"q", "quit", "exit"})
+
 
 class ChatPicker:
     """Interactive chat selection interface."""
@@ -14,6 +17,36 @@ class ChatPicker:
         """
         self.db = db
         self.contacts = contacts
+        # Chat rows keyed by (hint, limit), valid as long as chat.db's
+        # mtime is unchanged; repeat picks skip the query entirely.
+        self._row_cache: Dict[Tuple[Optional[str], int], List] = {}
+        self._cache_mtime: Optional[int] = None
+
+    def clear_cache(self) -> None:
+        """Drop cached chat rows so the next pick re-queries."""
+        self._row_cache.clear()
+        self._cache_mtime = None
+
+    def _fetch_rows(self, hint: Optional[str], limit: int) -> List:
+        """
+        Fetch chat rows, reusing the cache while chat.db is unchanged.
+        """
+        try:
+            mtime: Optional[int] = os.stat(self.db.db_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if mtime is None or mtime != self._cache_mtime:
+            self._row_cache.clear()
+            self._cache_mtime = mtime
+
+        key = (hint, limit)
+        rows = self._row_cache.get(key)
+        if rows is None:
+            rows = self.db.fetch_chats_with_latest(hint=hint, limit=limit)
+            if mtime is not None:
+                self._row_cache[key] = rows
+        return rows
 
     def pick(
         self,
@@ -25,63 +58,89 @@ class ChatPicker:
         Interactive chat picker.
         """
         if use_contacts:
-            self.contacts.build_lookup()
+            self.contacts.ensure_lookup()
             if not CONTACTS_AVAILABLE:
                 print(
                     "⚠️  Contacts framework not available. "
                     "Install: pyobjc-framework-Contacts"
                 )
 
-        rows: List = self.db.fetch_chats(limit=3000)
-
-        # Build filtered list
-        filtered = []
         hint_l = (hint or "").lower().strip()
 
-        for row in rows:
-            chat_id = int(row["chat_id"])
-            display_name = (row["display_name"] or "")
-            identifier = (row["chat_identifier"] or "")
-
-            label = (
-                self.contacts.format_chat_label(display_name, identifier)
-                if use_contacts
-                else (display_name or identifier or "(Unknown)")
-            )
-
-            if hint_l and not any(
-                hint_l in s.lower() for s in [display_name, identifier, label]
-            ):
-                continue
-
-            msg_id = self.db.get_latest_message_id(chat_id) or 0
-            filtered.append((msg_id, chat_id, label))
-
-        if not filtered:
+        if not use_contacts:
+            # Filtering, ordering by latest message, and limiting all
+            # happen in one SQL query.
+            rows: List = self._fetch_rows(hint_l or None, limit)
+            shown = [
+                (msg_id, chat_id, display_name or identifier or "(Unknown)")
+                for chat_id, display_name, identifier, msg_id in rows
+            ]
+        else:
+            # Contact labels can also match the hint, so keep that filter
+            # in Python over a larger (but still bounded) candidate window.
+            cap = limit * 10 if hint_l else limit
+            rows = self._fetch_rows(None, cap)
+
+            # Bound method hoisted out of the loop: one attribute lookup
+            # instead of two per row
+            format_label = self.contacts.format_chat_label
+
+            filtered = []
+            for chat_id, display_name, identifier, msg_id in rows:
+                # Rows are newest-first, so once `limit` survivors are
+                # collected the rest of the candidate window can't
+                # displace any of them — stop scanning (and labeling).
+                if len(filtered) == limit:
+                    break
+
+                display_name = display_name or ""
+                identifier = identifier or ""
+
+                # Test the cheap raw fields first; the contact label (a
+                # normalize + dict probe) is only built when those miss,
+                # so label-only matches still get through.
+                label = None
+                if hint_l and (
+                    hint_l not in display_name.lower()
+                    and hint_l not in identifier.lower()
+                ):
+                    label = format_label(display_name, identifier)
+                    if hint_l not in label.lower():
+                        continue
+
+                if label is None:
+                    label = format_label(display_name, identifier)
+
+                filtered.append((msg_id, chat_id, label))
+
+            shown = filtered
+
+        if not shown:
             raise RuntimeError("No recent chats matched. Try a different --hint.")
 
-        # Sort by most recent message
-        filtered.sort(reverse=True, key=lambda x: x[0])
-        shown = filtered[:limit]
-
         # Display options
         print("\nChoose a recent chat:\n")
         for i, (msg_id, chat_id, label) in enumerate(shown, start=1):
             print(f"{i:2d}) chat_id={chat_id:<6} last_msg={msg_id:<10}  name={label}")
 
-        # Get user input
+        # Get user input (loop invariants hoisted: the prompt string and
+        # option count don't change between retries)
+        n = len(shown)
+        prompt = f"\nEnter 1-{n} (or 'q' to quit): "
+
         while True:
-            choice = input(f"\nEnter 1-{len(shown)} (or 'q' to quit): ").strip()
+            choice = input(prompt).strip()
 
-            if choice.lower() in ("q", "quit", "exit"):
+            if choice.lower() in _QUIT_WORDS:
                 raise SystemExit(0)
 
-            if not choice.isdigit():
+            try:
+                idx = int(choice)
+            except ValueError:
                 print("Please enter a number.")
                 continue
 
-            idx = int(choice)
-            if 1 <= idx <= len(shown):
+            if 1 <= idx <= n:
                 _, chat_id, label = shown[idx - 1]
                 return chat_id, label
 
@@ -1,6 +1,17 @@
+import functools
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_cached(email: str) -> Optional[str]:
+    """Memoized implementation behind EmailNormalizer.normalize."""
+    email = email.lower()
+    if "@" not in email:
+        return None
+
+    return email
+
+
 class EmailNormalizer:
     """Utilities for normalizing email addresses."""
 
@@ -9,6 +20,8 @@ class EmailNormalizer:
         """
         Normalize an email address to lowercase.
 
+        Results are memoized since the same identifiers recur constantly.
+
         Args:
             email: Email address string
 
@@ -18,9 +31,4 @@ class EmailNormalizer:
         if not email:
             return None
 
-        email = email.strip().lower()
-        if "@" not in email:
-            return None
-
-        return email
-
+        return _normalize_cached(email.strip())
@@ -1,8 +1,16 @@
+import re
 import sqlite3
-from typing import Set
+from typing import Dict, Set
 
 from Foundation import NSData, NSUnarchiver  # type: ignore
 
+# Runs of printable ASCII, matched in one C-level pass over the blob
+_PRINTABLE_RE = re.compile(rb"[\x20-\x7e]{4,}")
+
+# NSArchiver header on attributedBody blobs; anything else is guaranteed
+# to fail NSUnarchiver, so skip the ObjC round-trip entirely
+_STREAMTYPED_MAGIC = b"\x04\x0bstreamtyped"
+
 
 class MessageDecoder:
     """Utilities for decoding message text from Messages database."""
@@ -16,35 +24,50 @@ class MessageDecoder:
         "__kIMMessagePartAttributeName",
     }
 
+    _BLACKLIST_BYTES: Set[bytes] = {s.encode("ascii") for s in BLACKLIST}
+
+    # Message bodies are immutable once written, so decoded text is cached
+    # by blob; polling re-reads the same recent rows every tick. Bounded
+    # with FIFO eviction.
+    _DECODE_CACHE: Dict[bytes, str] = {}
+    _DECODE_CACHE_MAX = 1024
+
+    # Extracted text keyed by msg_id: an integer lookup is cheaper than
+    # hashing the attributedBody blob when the same rows come back on
+    # consecutive polls.
+    _TEXT_CACHE: Dict[int, str] = {}
+    _TEXT_CACHE_MAX = 256
+
     @staticmethod
     def _scan_printable(blob: bytes, min_len: int = 4) -> str:
         """
         Scan binary data for printable ASCII sequences.
         """
-        runs = []
-        cur = bytearray()
-
-        for b in blob:
-            if 32 <= b <= 126:  # Printable ASCII
-                cur.append(b)
-            else:
-                if len(cur) >= min_len:
-                    runs.append(cur.decode("utf-8", errors="ignore"))
-                cur = bytearray()
-
-        if len(cur) >= min_len:
-            runs.append(cur.decode("utf-8", errors="ignore"))
-
-        candidates = [
-            r.strip()
-            for r in runs
-            if r.strip() and r.strip() not in MessageDecoder.BLACKLIST
-        ]
-
-        if not candidates:
-            return ""
-
-        return max(candidates, key=len)
+        if min_len == 4:
+            pattern = _PRINTABLE_RE
+        else:
+            pattern = re.compile(rb"[\x20-\x7e]{%d,}" % min_len)
+
+        # Track the longest candidate in a single pass instead of
+        # materializing every run and scanning the list again with max()
+        best = b""
+        best_len = 0
+        for match in pattern.finditer(blob):
+            # A run can only win if its raw length beats the current best
+            # (stripping never lengthens it), so most runs are rejected
+            # without extracting or blacklist-checking them.
+            if match.end() - match.start() <= best_len:
+                continue
+
+            stripped = match.group().strip()
+            if (
+                len(stripped) > best_len
+                and stripped not in MessageDecoder._BLACKLIST_BYTES
+            ):
+                best = stripped
+                best_len = len(stripped)
+
+        return best.decode("ascii")
 
     @staticmethod
     def decode_attributed_body(blob: bytes) -> str:
@@ -56,6 +79,25 @@ class MessageDecoder:
         if not blob:
             return ""
 
+        cache = MessageDecoder._DECODE_CACHE
+        cached = cache.get(blob)
+        if cached is not None:
+            return cached
+
+        text = MessageDecoder._decode_attributed_body(blob)
+
+        if len(cache) >= MessageDecoder._DECODE_CACHE_MAX:
+            cache.pop(next(iter(cache)))
+        cache[blob] = text
+
+        return text
+
+    @staticmethod
+    def _decode_attributed_body(blob: bytes) -> str:
+        """Uncached decode implementation."""
+        if not blob.startswith(_STREAMTYPED_MAGIC):
+            return MessageDecoder._scan_printable(blob)
+
         try:
             data = NSData.dataWithBytes_length_(blob, len(blob))
             obj = NSUnarchiver.unarchiveObjectWithData_(data)
@@ -78,13 +120,20 @@ class MessageDecoder:
         """
         Extract message text from a database row.
         """
+        msg_id = int(row["msg_id"])
+        cache = MessageDecoder._TEXT_CACHE
+        cached = cache.get(msg_id)
+        if cached is not None:
+            return cached
+
         txt = (row["text"] or "").strip()
-        if txt:
-            return txt
+        if not txt:
+            blob = row["attributedBody"]
+            txt = MessageDecoder.decode_attributed_body(blob) if blob else ""
 
-        blob = row["attributedBody"]
-        if blob:
-            return MessageDecoder.decode_attributed_body(blob)
+        if len(cache) >= MessageDecoder._TEXT_CACHE_MAX:
+            cache.pop(next(iter(cache)))
+        cache[msg_id] = txt
 
-        return ""
+        return txt
 
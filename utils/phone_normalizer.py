@@ -1,6 +1,32 @@
+import functools
 import re
 from typing import Optional
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_cached(phone: str) -> Optional[str]:
+    """Memoized implementation behind PhoneNormalizer.normalize."""
+    if not PhoneNormalizer.E164ISH.match(phone):
+        return None
+
+    digits = _NON_DIGIT_RE.sub("", phone)
+    if not digits:
+        return None
+
+    # Heuristic: if it already had + or looks like full intl, keep +.
+    # If it's 10 digits, assume US +1.
+    if len(digits) == 10:
+        return "+1" + digits
+    if phone.startswith("+"):
+        return "+" + digits
+    # If 11 digits and starts with 1, treat as +1
+    if len(digits) == 11 and digits.startswith("1"):
+        return "+" + digits
+    # Otherwise just +digits
+    return "+" + digits
+
 
 class PhoneNormalizer:
     """Utilities for normalizing phone numbers to E.164 format."""
@@ -12,6 +38,9 @@ class PhoneNormalizer:
         """
         Normalize a phone number string to E.164 format.
 
+        The same identifiers recur constantly (contact enumeration, chat
+        labels), so results are memoized.
+
         Args:
             phone: Phone number string (may contain formatting)
 
@@ -22,23 +51,4 @@ class PhoneNormalizer:
         if not phone:
             return None
 
-        phone = phone.strip()
-        if not PhoneNormalizer.E164ISH.match(phone):
-            return None
-
-        digits = re.sub(r"\D", "", phone)
-        if not digits:
-            return None
-
-        # Heuristic: if it already had + or looks like full intl, keep +.
-        # If it's 10 digits, assume US +1.
-        if len(digits) == 10:
-            return "+1" + digits
-        if phone.startswith("+"):
-            return "+" + digits
-        # If 11 digits and starts with 1, treat as +1
-        if len(digits) == 11 and digits.startswith("1"):
-            return "+" + digits
-        # Otherwise just +digits
-        return "+" + digits
-
+        return _normalize_cached(phone.strip())